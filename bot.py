@@ -1,10 +1,19 @@
+import time
+
+# Taken before the heavy imports below so startup timing covers them
+process_started = time.perf_counter()
+
 import os
+import asyncio
 import logging
 import tempfile
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import Application, CommandHandler, MessageHandler, CallbackContext, CallbackQueryHandler, filters
 from dotenv import load_dotenv
 
+from config import Settings, load_settings
+from eta import format_eta, get_predictor, init_predictor
+from startup import warm_up
 from script_gen import generate_script
 from voice_gen import generate_voice
 from video_gen import generate_avatar_video
@@ -19,9 +28,11 @@ logging.basicConfig(
     level=logging.INFO
 )
 logger = logging.getLogger(__name__)
+logger.info(f"Modules imported in {time.perf_counter() - process_started:.3f}s")
 
 class VideoCreatorBot:
-    def __init__(self):
+    def __init__(self, settings: Settings):
+        self.settings = settings
         self.user_states = {}
 
     async def start(self, update: Update, context: CallbackContext) -> None:
@@ -83,13 +94,14 @@ class VideoCreatorBot:
                 text_input = update.message.text
 
             # Generate optimized script
-            script = generate_script(text_input, user_state['input_type'])
+            script = generate_script(text_input, user_state['input_type'], self.settings.openai_api_key)
 
             # Voice generation provider selection
-            keyboard = [
-                [InlineKeyboardButton("🔊 Eleven Labs", callback_data='eleven_labs')],
-                [InlineKeyboardButton("🔈 Deep Labs", callback_data='deep_labs')]
-            ]
+            provider_buttons = {
+                'eleven_labs': InlineKeyboardButton("🔊 Eleven Labs", callback_data='eleven_labs'),
+                'deep_labs': InlineKeyboardButton("🔈 Deep Labs", callback_data='deep_labs')
+            }
+            keyboard = [[provider_buttons[p]] for p in self.settings.voice_providers]
             reply_markup = InlineKeyboardMarkup(keyboard)
 
             # Store script for next steps
@@ -115,21 +127,30 @@ class VideoCreatorBot:
             return
 
         provider = query.data
+        if provider not in self.settings.voice_providers:
+            await query.edit_message_text("❌ This voice provider is not configured. Please choose another.")
+            return
+
         try:
-            # Generate voice based on provider
+            estimate = get_predictor().estimate('voice', provider, len(script))
+            await query.message.reply_text(f"⏳ Generating voice, ETA {format_eta(estimate.expected)}")
+
+            # Generate voice based on provider, off the event loop
             if provider == 'eleven_labs':
-                voice_path = generate_voice(
+                voice_path = await asyncio.to_thread(
+                    generate_voice,
                     text=script,
                     provider='eleven_labs',
-                    eleven_api_key=os.getenv('ELEVEN_LABS_API_KEY'),
-                    voice_id=os.getenv('DEFAULT_ELEVEN_VOICE_ID')
+                    eleven_api_key=self.settings.eleven_labs_api_key,
+                    voice_id=self.settings.eleven_voice_id
                 )
             else:
-                voice_path = generate_voice(
+                voice_path = await asyncio.to_thread(
+                    generate_voice,
                     text=script,
                     provider='deep_labs',
-                    base_url=os.getenv('DEEP_LABS_BASE_URL'),
-                    ref_audio_id=os.getenv('DEEP_LABS_REF_VOICE_ID')
+                    base_url=self.settings.deep_labs_base_url,
+                    ref_audio_id=self.settings.deep_labs_ref_voice_id
                 )
 
             # Send voice file
@@ -170,15 +191,46 @@ class VideoCreatorBot:
             await query.edit_message_text("❌ Missing voice or script. Please restart.")
             return
 
+        status_message = None
+        progress_updates = []
+        rendered = False
         try:
-            # Generate video
-            video_path, message = generate_avatar_video(
-                audio_path=voice_path,
-                api_key=os.getenv('HEYGEN_API_KEY'),
-                avatar_id=os.getenv('HEYGEN_AVATAR_ID'),
-                text=script,
-                heygen_voice_id=os.getenv('HEYGEN_VOICE_ID')
+            estimate = get_predictor().estimate(
+                'render', 'heygen', len(script), avatar=self.settings.heygen_avatar_id
             )
+            status_message = await query.message.reply_text(
+                f"🎬 Rendering video, ETA {format_eta(estimate.expected)}"
+            )
+            loop = asyncio.get_running_loop()
+
+            def report_progress(elapsed, estimate):
+                remaining = estimate.expected - elapsed
+                if remaining > 0:
+                    text = f"🎬 Rendering video, {format_eta(remaining)} left"
+                else:
+                    text = f"🎬 Rendering video, taking longer than usual ({format_eta(elapsed)} so far)"
+                progress_updates.append(
+                    asyncio.run_coroutine_threadsafe(self._edit_status(status_message, text), loop)
+                )
+
+            # Generate video, off the event loop so progress edits can be sent
+            try:
+                video_path, message = await asyncio.to_thread(
+                    generate_avatar_video,
+                    audio_path=voice_path,
+                    api_key=self.settings.heygen_api_key,
+                    avatar_id=self.settings.heygen_avatar_id,
+                    text=script,
+                    heygen_voice_id=self.settings.heygen_voice_id,
+                    estimate=estimate,
+                    on_progress=report_progress
+                )
+            finally:
+                # Let in-flight progress edits land before the final status
+                await asyncio.gather(*(asyncio.wrap_future(f) for f in progress_updates))
+
+            rendered = True
+            await self._edit_status(status_message, "✅ Video rendered")
 
             # Send video
             with open(video_path, 'rb') as video_file:
@@ -197,8 +249,17 @@ class VideoCreatorBot:
 
         except Exception as e:
             logger.error(f"Video generation error: {e}")
+            if status_message and not rendered:
+                await self._edit_status(status_message, "❌ Video rendering stopped")
             await query.edit_message_text(f"⚠️ Video generation failed: {e}")
 
+    async def _edit_status(self, message, text: str) -> None:
+        """Update a progress message, ignoring failures"""
+        try:
+            await message.edit_text(text)
+        except Exception as e:
+            logger.debug(f"Progress update failed: {e}")
+
     def setup_handlers(self, app):
         """Set up all bot handlers"""
         app.add_handler(CommandHandler('start', self.start))
@@ -227,12 +288,19 @@ class VideoCreatorBot:
 
 def main():
     """Main bot initialization"""
-    app = Application.builder().token(os.getenv('TELEGRAM_TOKEN')).build()
+    # Fail fast on configuration errors, before accepting any updates
+    settings = load_settings()
+    init_predictor(settings.eta_store_path)
+
+    # Provider SDKs and connections are prepared off the startup path
+    warm_up(settings)
+
+    app = Application.builder().token(settings.telegram_token).build()
 
-    bot = VideoCreatorBot()
+    bot = VideoCreatorBot(settings)
     bot.setup_handlers(app)
 
-    logger.info("Video Creator Bot started...")
+    logger.info(f"Video Creator Bot started in {time.perf_counter() - process_started:.3f}s")
     app.run_polling(drop_pending_updates=True)
 
 if __name__ == '__main__':
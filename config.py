@@ -0,0 +1,81 @@
+import os
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ETA_STORE_PATH = '.eta_stats.json'
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Validated bot configuration, loaded once at startup"""
+    telegram_token: str
+    openai_api_key: str
+    heygen_api_key: str
+    heygen_avatar_id: str
+    heygen_voice_id: Optional[str] = None
+    eleven_labs_api_key: Optional[str] = None
+    eleven_voice_id: Optional[str] = None
+    deep_labs_base_url: Optional[str] = None
+    deep_labs_ref_voice_id: Optional[str] = None
+    eta_store_path: str = DEFAULT_ETA_STORE_PATH
+
+    @property
+    def voice_providers(self) -> list:
+        """Voice providers with complete configuration, in menu order"""
+        providers = []
+        if self.eleven_labs_api_key and self.eleven_voice_id:
+            providers.append('eleven_labs')
+        if self.deep_labs_ref_voice_id:
+            providers.append('deep_labs')
+        return providers
+
+
+def _env(name: str) -> Optional[str]:
+    """Read an environment variable, treating blank values as unset"""
+    value = os.getenv(name, '').strip()
+    return value or None
+
+
+def load_settings() -> Settings:
+    """
+    Read and validate all configuration from the environment
+
+    :return: Settings instance
+    :raises ValueError: Listing every missing or inconsistent variable
+    """
+    required = {
+        'telegram_token': 'TELEGRAM_TOKEN',
+        'openai_api_key': 'OPENAI_API_KEY',
+        'heygen_api_key': 'HEYGEN_API_KEY',
+        'heygen_avatar_id': 'HEYGEN_AVATAR_ID',
+    }
+    optional = {
+        'heygen_voice_id': 'HEYGEN_VOICE_ID',
+        'eleven_labs_api_key': 'ELEVEN_LABS_API_KEY',
+        'eleven_voice_id': 'DEFAULT_ELEVEN_VOICE_ID',
+        'deep_labs_base_url': 'DEEP_LABS_BASE_URL',
+        'deep_labs_ref_voice_id': 'DEEP_LABS_REF_VOICE_ID',
+    }
+
+    values = {field: _env(var) for field, var in {**required, **optional}.items()}
+    errors = [f"{var} is not set" for field, var in required.items() if not values[field]]
+
+    # ElevenLabs needs both the key and a voice to be usable
+    if bool(values['eleven_labs_api_key']) != bool(values['eleven_voice_id']):
+        errors.append("ELEVEN_LABS_API_KEY and DEFAULT_ELEVEN_VOICE_ID must be set together")
+
+    if errors:
+        raise ValueError("Invalid configuration: " + "; ".join(errors))
+
+    settings = Settings(**values, eta_store_path=_env('ETA_STORE_PATH') or DEFAULT_ETA_STORE_PATH)
+    if not settings.voice_providers:
+        raise ValueError(
+            "Invalid configuration: no voice provider configured "
+            "(set ELEVEN_LABS_API_KEY/DEFAULT_ELEVEN_VOICE_ID or DEEP_LABS_REF_VOICE_ID)"
+        )
+
+    logger.info(f"Configuration loaded, voice providers: {', '.join(settings.voice_providers)}")
+    return settings
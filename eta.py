@@ -0,0 +1,247 @@
+import os
+import json
+import math
+import logging
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Weight kept by older samples on each update, so estimates follow provider drift
+DECAY = 0.95
+
+# Samples needed before learned stats replace the priors
+MIN_SAMPLES = 3
+
+# Each timeout since the last completed run widens the next timeout by this factor,
+# so a budget that was too tight recovers without skewing the learned durations
+TIMEOUT_BACKOFF = 1.5
+MAX_BACKOFF_STEPS = 4
+
+# (intercept seconds, seconds per script character) used until history exists
+PRIORS = {
+    ("voice", "eleven_labs"): (5.0, 0.01),
+    ("voice", "deep_labs"): (20.0, 0.1),
+    ("render", "heygen"): (120.0, 0.25),
+}
+
+# (min, max) timeout in seconds for any job
+TIMEOUT_BOUNDS = {
+    ("voice", "eleven_labs"): (30.0, 120.0),
+    ("voice", "deep_labs"): (30.0, 900.0),
+    ("render", "heygen"): (60.0, 3600.0),
+}
+
+# Timeout floor while there is no history, matching the previous fixed budgets
+# (Deep Labs covers synthesis plus the download retries that follow it)
+COLD_START_TIMEOUTS = {
+    ("voice", "eleven_labs"): 30.0,
+    ("voice", "deep_labs"): 400.0,
+    ("render", "heygen"): 300.0,
+}
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """Predicted duration of a job stage"""
+    expected: float
+    timeout: float
+    samples: int
+
+    def poll_interval(self, elapsed: float, min_interval: float = 5.0, max_interval: float = 30.0) -> float:
+        """
+        Seconds to wait before the next status check
+
+        Polls sparsely while the job is far from its expected finish and
+        densely around it, then backs off once it is overdue.
+
+        :param elapsed: Seconds since the job was submitted
+        :param min_interval: Shortest allowed wait
+        :param max_interval: Longest allowed wait
+        :return: Seconds to sleep
+        """
+        remaining = self.expected - elapsed
+        if remaining > 0:
+            interval = remaining / 2
+        else:
+            interval = -remaining / 4
+        interval = max(min_interval, min(max_interval, interval))
+        return max(0.0, min(interval, self.timeout - elapsed))
+
+
+def format_eta(seconds: float) -> str:
+    """Human readable duration for progress messages"""
+    seconds = max(0, int(round(seconds)))
+    if seconds < 60:
+        return f"~{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    return f"~{minutes}m {seconds:02d}s"
+
+
+class EtaPredictor:
+    """
+    Learns stage durations from history and turns them into ETAs and timeouts
+
+    Durations are modelled per (stage, provider, avatar) as a linear function
+    of script length. Each key only keeps exponentially decayed regression
+    sums, the longest script seen, the number of completed runs and the
+    number of timeouts since the last completed run, persisted as a small
+    JSON file. Timed-out jobs never enter the regression sums.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stats = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable ETA store {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            with tempfile.NamedTemporaryFile("w", dir=directory, delete=False, suffix=".tmp") as f:
+                json.dump(self._stats, f, separators=(",", ":"))
+            os.replace(f.name, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save ETA store {self.path}: {e}")
+
+    @staticmethod
+    def _key(stage: str, provider: str, avatar: Optional[str] = None) -> str:
+        return f"{stage}|{provider}|{avatar or '*'}"
+
+    @staticmethod
+    def _entry(stats: Optional[list]) -> list:
+        """
+        Stored stats padded to the current layout
+
+        [n, sx, sy, sxx, sxy, syy, max_chars, runs, timeouts], where n and the
+        sums are decayed and runs counts completed jobs undecayed.
+        """
+        stats = list(stats or [0.0] * 6)
+        if len(stats) < 7:
+            stats.append(0.0)
+        if len(stats) < 8:
+            stats.append(round(stats[0]))
+        if len(stats) < 9:
+            stats.append(0)
+        return stats
+
+    def record(self, stage: str, provider: str, chars: int, seconds: float, avatar: Optional[str] = None) -> None:
+        """
+        Add a completed stage duration to the history
+
+        :param stage: Pipeline stage (voice, render)
+        :param provider: Provider that ran the stage
+        :param chars: Script length in characters
+        :param seconds: Wall clock duration of the stage
+        :param avatar: Avatar ID, if the duration depends on it
+        """
+        keys = {self._key(stage, provider), self._key(stage, provider, avatar)}
+        with self._lock:
+            for key in keys:
+                stats = self._entry(self._stats.get(key))
+                n, sx, sy, sxx, sxy, syy = (v * DECAY for v in stats[:6])
+                self._stats[key] = [
+                    round(v, 3) for v in (
+                        n + 1, sx + chars, sy + seconds,
+                        sxx + chars * chars, sxy + chars * seconds, syy + seconds * seconds
+                    )
+                ] + [max(stats[6], chars), stats[7] + 1, 0]
+            self._save()
+        logger.info(f"Recorded {stage}/{provider} duration {seconds:.1f}s for {chars} chars")
+
+    def record_timeout(self, stage: str, provider: str, chars: int, avatar: Optional[str] = None) -> None:
+        """
+        Note a job that hit its timeout, whose true duration is unknown
+
+        Only widens later timeouts; expected durations are learned from
+        completed runs alone.
+
+        :param stage: Pipeline stage (voice, render)
+        :param provider: Provider that ran the stage
+        :param chars: Script length in characters
+        :param avatar: Avatar ID, if the duration depends on it
+        """
+        keys = {self._key(stage, provider), self._key(stage, provider, avatar)}
+        with self._lock:
+            for key in keys:
+                stats = self._entry(self._stats.get(key))
+                stats[8] += 1
+                self._stats[key] = stats
+            self._save()
+        logger.warning(f"{stage}/{provider} timed out for {chars} chars")
+
+    def estimate(self, stage: str, provider: str, chars: int, avatar: Optional[str] = None) -> Estimate:
+        """
+        Predict duration and timeout for a job
+
+        :param stage: Pipeline stage (voice, render)
+        :param provider: Provider that will run the stage
+        :param chars: Script length in characters
+        :param avatar: Avatar ID, if the duration depends on it
+        :return: Estimate
+        """
+        with self._lock:
+            stats = self._entry(self._stats.get(self._key(stage, provider, avatar)))
+            if stats[7] < MIN_SAMPLES:
+                stats = self._entry(self._stats.get(self._key(stage, provider)))
+
+        low, high = TIMEOUT_BOUNDS.get((stage, provider), (30.0, 3600.0))
+        prior_intercept, prior_slope = PRIORS.get((stage, provider), (60.0, 0.0))
+        prior_expected = prior_intercept + prior_slope * chars
+        cold_timeout = max(COLD_START_TIMEOUTS.get((stage, provider), low), 2 * prior_expected)
+        max_x, runs, timeouts = stats[6:9]
+        backoff = TIMEOUT_BACKOFF ** min(timeouts, MAX_BACKOFF_STEPS)
+
+        if runs < MIN_SAMPLES:
+            return Estimate(prior_expected, min(cold_timeout * backoff, high), int(runs))
+
+        n, sx, sy, sxx, sxy, syy = stats[:6]
+        mean_x, mean_y = sx / n, sy / n
+        var_x = sxx / n - mean_x ** 2
+        var_y = syy / n - mean_y ** 2
+        cov = sxy / n - mean_x * mean_y
+
+        # Keep the prior's per-character cost when lengths are too similar to fit a slope
+        if var_x > 100.0:
+            slope = max(0.0, cov / var_x)
+            sigma = math.sqrt(max(0.0, var_y - slope * cov))
+        else:
+            slope = prior_slope
+            sigma = math.sqrt(max(0.0, var_y))
+        expected = max(1.0, mean_y + slope * (chars - mean_x))
+
+        timeout = expected + 3 * sigma + max(10.0, 0.25 * expected)
+
+        # History says nothing about scripts longer than any seen so far
+        if chars > max_x:
+            timeout = max(timeout, cold_timeout)
+
+        return Estimate(expected, max(low, min(high, timeout * backoff)), int(runs))
+
+
+_predictor = None
+
+
+def init_predictor(path: str) -> EtaPredictor:
+    """Create the shared predictor backed by the given store"""
+    global _predictor
+    _predictor = EtaPredictor(path)
+    return _predictor
+
+
+def get_predictor() -> EtaPredictor:
+    """Return the shared predictor set up by init_predictor"""
+    if _predictor is None:
+        raise RuntimeError("ETA predictor not initialised, call init_predictor first")
+    return _predictor
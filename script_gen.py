@@ -1,20 +1,20 @@
-import os
 import logging
-from openai import OpenAI
 
-logging.basicConfig(level=logging.INFO)
+from startup import get_openai_client
+
 logger = logging.getLogger(__name__)
 
-def generate_script(user_input: str, input_type: str) -> str:
+def generate_script(user_input: str, input_type: str, api_key: str) -> str:
     """
     Generate a refined script based on user input and input type
     
     :param user_input: Original text from user
     :param input_type: Type of input (text_script, video_idea, voice_idea)
+    :param api_key: OpenAI API key
     :return: Refined and optimized script
     """
     try:
-        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        client = get_openai_client(api_key)
         
         input_type_prompts = {
             'text_script': "Refine this script for clarity and engagement:",
@@ -0,0 +1,110 @@
+import time
+import logging
+import importlib
+import threading
+from types import ModuleType
+
+logger = logging.getLogger(__name__)
+
+# Seconds spent importing each lazily loaded module
+import_timings = {}
+
+_import_lock = threading.Lock()
+_session = None
+_session_lock = threading.Lock()
+_openai_clients = {}
+_openai_lock = threading.Lock()
+
+# Hosts reached through http_session, connected ahead of time by warm_up
+HEYGEN_HOSTS = ("https://api.heygen.com", "https://upload.heygen.com")
+VOICE_PROVIDER_HOSTS = {
+    "eleven_labs": ("https://api.elevenlabs.io",),
+    "deep_labs": ("https://api.msganesh.com",),
+}
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module on first use and record how long it took
+
+    :param name: Dotted module name
+    :return: Imported module
+    """
+    with _import_lock:
+        if name in import_timings:
+            return importlib.import_module(name)
+
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        import_timings[name] = time.perf_counter() - started
+
+    logger.info(f"Imported {name} in {import_timings[name]:.3f}s")
+    return module
+
+
+def http_session():
+    """
+    Shared requests session so provider calls reuse pooled connections
+
+    :return: requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                requests = lazy_import("requests")
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def get_openai_client(api_key: str):
+    """
+    Shared OpenAI client, importing the SDK on first use
+
+    The SDK keeps its own connection pool, so reusing the client keeps
+    connections warm between requests.
+
+    :param api_key: OpenAI API key
+    :return: openai.OpenAI
+    """
+    with _openai_lock:
+        if api_key not in _openai_clients:
+            openai = lazy_import("openai")
+            _openai_clients[api_key] = openai.OpenAI(api_key=api_key)
+        return _openai_clients[api_key]
+
+
+def warm_up(settings) -> threading.Thread:
+    """
+    Import provider SDKs and open provider connections in a background thread
+
+    Only providers enabled in the settings are contacted.
+
+    :param settings: Validated Settings
+    :return: The started daemon thread
+    """
+    def _run():
+        started = time.perf_counter()
+        try:
+            get_openai_client(settings.openai_api_key)
+        except ImportError as e:
+            logger.warning(f"Pre-warm of OpenAI client failed: {e}")
+
+        hosts = list(HEYGEN_HOSTS)
+        for provider in settings.voice_providers:
+            hosts.extend(VOICE_PROVIDER_HOSTS.get(provider, ()))
+
+        for host in hosts:
+            try:
+                http_session().head(host, timeout=5)
+            except Exception as e:
+                logger.debug(f"Pre-warm connection to {host} failed: {e}")
+
+        logger.info(f"Pre-warm finished in {time.perf_counter() - started:.3f}s")
+
+    thread = threading.Thread(target=_run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
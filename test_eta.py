@@ -0,0 +1,66 @@
+import pytest
+
+import eta
+from eta import EtaPredictor
+
+
+@pytest.fixture
+def predictor(tmp_path):
+    return EtaPredictor(str(tmp_path / "eta.json"))
+
+
+def test_cold_start_uses_priors(predictor):
+    estimate = predictor.estimate("render", "heygen", 500)
+
+    intercept, slope = eta.PRIORS[("render", "heygen")]
+    assert estimate.expected == intercept + slope * 500
+    assert estimate.timeout == max(eta.COLD_START_TIMEOUTS[("render", "heygen")], 2 * estimate.expected)
+    assert estimate.samples == 0
+
+
+def test_learned_estimate_after_min_samples(predictor):
+    for _ in range(eta.MIN_SAMPLES - 1):
+        predictor.record("render", "heygen", 500, 150.0)
+    assert predictor.estimate("render", "heygen", 500).expected == 245.0
+
+    predictor.record("render", "heygen", 500, 150.0)
+    estimate = predictor.estimate("render", "heygen", 500)
+    assert estimate.samples == eta.MIN_SAMPLES
+    assert estimate.expected == pytest.approx(150.0, rel=1e-3)
+    assert estimate.timeout < eta.COLD_START_TIMEOUTS[("render", "heygen")]
+
+
+def test_longer_script_keeps_cold_start_floor(predictor):
+    for _ in range(4):
+        predictor.record("render", "heygen", 800, 50.0)
+
+    seen = predictor.estimate("render", "heygen", 800)
+    longer = predictor.estimate("render", "heygen", 3000)
+
+    assert seen.timeout < 100
+    assert longer.expected > seen.expected
+    assert longer.timeout >= eta.COLD_START_TIMEOUTS[("render", "heygen")]
+
+
+def test_timeouts_widen_budget_without_moving_expected(predictor):
+    for _ in range(20):
+        predictor.record("render", "heygen", 500, 150.0)
+    steady = predictor.estimate("render", "heygen", 500)
+
+    for _ in range(50):
+        predictor.record_timeout("render", "heygen", 500)
+    stuck = predictor.estimate("render", "heygen", 500)
+
+    assert stuck.expected == steady.expected
+    assert steady.timeout < stuck.timeout <= steady.timeout * eta.TIMEOUT_BACKOFF ** eta.MAX_BACKOFF_STEPS
+
+    predictor.record("render", "heygen", 500, 150.0)
+    assert predictor.estimate("render", "heygen", 500).timeout == pytest.approx(steady.timeout, rel=0.05)
+
+
+def test_store_round_trip(predictor):
+    for _ in range(3):
+        predictor.record("voice", "deep_labs", 400, 60.0, avatar=None)
+
+    reloaded = EtaPredictor(predictor.path)
+    assert reloaded.estimate("voice", "deep_labs", 400) == predictor.estimate("voice", "deep_labs", 400)
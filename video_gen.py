@@ -1,10 +1,11 @@
 import os
 import time
 import logging
-import requests
 import uuid
 
-logging.basicConfig(level=logging.INFO)
+from eta import Estimate, get_predictor
+from startup import http_session
+
 logger = logging.getLogger(__name__)
 
 def upload_asset_to_heygen(file_path: str, api_key: str, content_type: str = "audio/x-wav") -> str:
@@ -39,7 +40,7 @@ def upload_asset_to_heygen(file_path: str, api_key: str, content_type: str = "au
         
         # Open and upload file
         with open(file_path, 'rb') as f:
-            response = requests.post(
+            response = http_session().post(
                 url, 
                 data=f, 
                 headers=headers, 
@@ -68,7 +69,9 @@ def generate_avatar_video(
     api_key: str = None, 
     avatar_id: str = None, 
     text: str = None, 
-    heygen_voice_id: str = None
+    heygen_voice_id: str = None,
+    estimate: Estimate = None,
+    on_progress=None
 ) -> tuple:
     """
     Generate avatar video with comprehensive fallback mechanism
@@ -78,6 +81,8 @@ def generate_avatar_video(
     :param avatar_id: HeyGen avatar ID
     :param text: Fallback text for voice generation
     :param heygen_voice_id: HeyGen voice ID for text-to-speech
+    :param estimate: Predicted render time, computed from history if not given
+    :param on_progress: Optional callback(elapsed, estimate) called on each status check
     :return: Tuple of (video_path, message)
     """
     try:
@@ -148,7 +153,7 @@ def generate_avatar_video(
         }
         
         # Send video generation request
-        response = requests.post(
+        response = http_session().post(
             "https://api.heygen.com/v2/video/generate",
             json=payload,
             headers=headers,
@@ -164,57 +169,88 @@ def generate_avatar_video(
         if not video_id:
             raise ValueError("No video ID in response")
         
-        # Poll for video status
-        return poll_video_status(video_id, api_key)
+        # Poll for video status on a schedule learned from previous renders
+        return poll_video_status(
+            video_id,
+            api_key,
+            estimate=estimate,
+            on_progress=on_progress,
+            chars=len(text or ""),
+            avatar_id=avatar_id
+        )
     
     except Exception as e:
         logger.error(f"Video generation error: {e}")
         raise
 
-def poll_video_status(video_id: str, api_key: str, max_retries: int = 30, interval: int = 10) -> tuple:
+def poll_video_status(
+    video_id: str,
+    api_key: str,
+    estimate: Estimate = None,
+    on_progress=None,
+    chars: int = 0,
+    avatar_id: str = None
+) -> tuple:
     """
     Poll HeyGen video generation status
     
     :param video_id: Video generation job ID
     :param api_key: HeyGen API key
-    :param max_retries: Maximum number of polling attempts
-    :param interval: Seconds between polling attempts
+    :param estimate: Predicted render time, sets the polling schedule and deadline
+    :param on_progress: Optional callback(elapsed, estimate) called on each status check
+    :param chars: Script length, recorded with the render duration
+    :param avatar_id: HeyGen avatar ID, recorded with the render duration
     :return: Tuple of (video_path, message)
     """
     headers = {"x-api-key": api_key}
-    
-    for attempt in range(1, max_retries + 1):
+    predictor = get_predictor()
+    if estimate is None:
+        estimate = predictor.estimate("render", "heygen", chars, avatar=avatar_id)
+
+    started = time.monotonic()
+    attempt = 0
+    while time.monotonic() - started < estimate.timeout:
+        time.sleep(estimate.poll_interval(time.monotonic() - started))
+        elapsed = time.monotonic() - started
+        attempt += 1
+
         try:
             # Check video status
             status_url = f"https://api.heygen.com/v1/video_status.get?video_id={video_id}"
-            response = requests.get(status_url, headers=headers, timeout=30)
+            response = http_session().get(status_url, headers=headers, timeout=30)
             response.raise_for_status()
             
             # Parse response
             data = response.json().get("data", {})
             status = data.get("status")
-            
-            # Handle different statuses
-            if status == "completed":
-                video_url = data.get("video_url")
-                if not video_url:
-                    raise ValueError("No video URL in completed response")
-                
-                # Download video
-                return download_video(video_url)
-            
-            elif status == "failed":
-                raise ValueError("Video generation failed on server")
-            
-            # Wait before next attempt
-            logger.info(f"Video status: {status} (Attempt {attempt}/{max_retries})")
-            time.sleep(interval)
         
         except Exception as e:
             logger.warning(f"Status polling error (Attempt {attempt}): {e}")
-            time.sleep(interval)
+            continue
+
+        # Handle different statuses
+        if status == "completed":
+            video_url = data.get("video_url")
+            if not video_url:
+                raise ValueError("No video URL in completed response")
+            
+            predictor.record("render", "heygen", chars, elapsed, avatar=avatar_id)
+
+            # Download video
+            return download_video(video_url)
+        
+        elif status == "failed":
+            raise ValueError("Video generation failed on server")
+        
+        logger.info(
+            f"Video status: {status} (Attempt {attempt}, {elapsed:.0f}s of "
+            f"expected {estimate.expected:.0f}s, timeout {estimate.timeout:.0f}s)"
+        )
+        if on_progress:
+            on_progress(elapsed, estimate)
     
-    raise TimeoutError("Video generation timed out")
+    predictor.record_timeout("render", "heygen", chars, avatar=avatar_id)
+    raise TimeoutError(f"Video generation timed out after {estimate.timeout:.0f}s")
 
 def download_video(url: str) -> tuple:
     """
@@ -225,7 +261,7 @@ def download_video(url: str) -> tuple:
     """
     try:
         # Download video
-        response = requests.get(url, stream=True, timeout=30)
+        response = http_session().get(url, stream=True, timeout=30)
         response.raise_for_status()
         
         # Generate unique filename
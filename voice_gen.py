@@ -1,14 +1,15 @@
-import os
 import uuid
 import logging
-import requests
 import time
 
-logging.basicConfig(level=logging.INFO)
+from eta import get_predictor
+from startup import http_session, lazy_import
+
 logger = logging.getLogger(__name__)
 
 def generate_eleven_labs_voice(text: str, api_key: str, voice_id: str) -> str:
     """Generate voice using ElevenLabs API with enhanced error handling"""
+    requests = lazy_import("requests")
     try:
         url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
         headers = {
@@ -28,13 +29,18 @@ def generate_eleven_labs_voice(text: str, api_key: str, voice_id: str) -> str:
             }
         }
 
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        predictor = get_predictor()
+        estimate = predictor.estimate("voice", "eleven_labs", len(text))
+        started = time.monotonic()
+
+        response = http_session().post(url, headers=headers, json=payload, timeout=estimate.timeout)
         response.raise_for_status()
 
         audio_path = f"eleven_voice_{uuid.uuid4().hex}.mp3"
         with open(audio_path, "wb") as f:
             f.write(response.content)
 
+        predictor.record("voice", "eleven_labs", len(text), time.monotonic() - started)
         return audio_path
 
     except requests.RequestException as e:
@@ -43,22 +49,35 @@ def generate_eleven_labs_voice(text: str, api_key: str, voice_id: str) -> str:
 
 def generate_deep_labs_voice(text: str, base_url: str, ref_audio_id: str = None) -> str:
     """Generate voice using Deep Labs API with comprehensive polling"""
+    requests = lazy_import("requests")
     try:
         generate_url = f"https://api.msganesh.com/itts/generate_speech"
         headers = {"Content-Type": "application/json"}
-        ref_audio_id = os.environ["DEEP_LABS_REF_VOICE_ID"]
+        if not ref_audio_id:
+            raise ValueError("Deep Labs reference voice ID is not configured")
+
         payload = {
                     "text": text,
                     "ref_audio_id": ref_audio_id
                     }
-        
-        if ref_audio_id:
-            payload["ref_audio_id"] = ref_audio_id
 
         print("Payload: ", payload)
         print("Headers: ", headers)
         print("Generate URL: ", generate_url)
-        response = requests.post(generate_url, json=payload, headers=headers, timeout=200)
+
+        # The stage runs from submission until the audio file is written. The
+        # requests timeout only bounds each socket read, so the total deadline
+        # is enforced separately across the download retries.
+        predictor = get_predictor()
+        estimate = predictor.estimate("voice", "deep_labs", len(text))
+        started = time.monotonic()
+        deadline = started + estimate.timeout
+
+        try:
+            response = http_session().post(generate_url, json=payload, headers=headers, timeout=estimate.timeout)
+        except requests.Timeout:
+            predictor.record_timeout("voice", "deep_labs", len(text))
+            raise
         response.raise_for_status()
 
         audio_id = response.json().get("id")
@@ -68,17 +87,22 @@ def generate_deep_labs_voice(text: str, base_url: str, ref_audio_id: str = None)
         for attempt in range(10):
             try:
                 download_url = f"https://api.msganesh.com/itts/{audio_id}.wav"
-                audio_response = requests.get(download_url, timeout=30)
+                audio_response = http_session().get(download_url, timeout=30)
                 audio_response.raise_for_status()
 
                 audio_path = f"deep_voice_{uuid.uuid4().hex}.wav"
                 with open(audio_path, "wb") as f:
                     f.write(audio_response.content)
 
+                predictor.record("voice", "deep_labs", len(text), time.monotonic() - started)
                 return audio_path
 
             except requests.RequestException:
-                time.sleep(min(2 ** attempt, 30))
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    predictor.record_timeout("voice", "deep_labs", len(text))
+                    raise TimeoutError(f"Voice audio not ready after {estimate.timeout:.0f}s")
+                time.sleep(min(2 ** attempt, 30, remaining))
 
         raise TimeoutError("Could not retrieve voice audio after multiple attempts")
 